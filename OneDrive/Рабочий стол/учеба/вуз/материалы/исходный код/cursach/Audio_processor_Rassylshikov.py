@@ -1,41 +1,286 @@
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import wave
 import struct
+import json
 import math
+import mmap
+import cmath
 import os
+import random
+import sys
+import threading
+import queue
+from array import array
+from collections import OrderedDict
+
+
+# Поддерживаемые расширения файлов
+SUPPORTED_EXTENSIONS = ('.wav', '.rf64', '.w64')
+
+# Идентификаторы (GUID) фрагментов формата Sony Wave64
+W64_RIFF_GUID = b'riff\x2e\x91\xcf\x11\xa5\xd6\x28\xdb\x04\xc1\x00\x00'
+W64_WAVE_GUID = b'wave\xf3\xac\xd3\x11\x8c\xd1\x00\xc0\x4f\x8e\xdb\x8a'
+W64_FMT_GUID = b'fmt \xf3\xac\xd3\x11\x8c\xd1\x00\xc0\x4f\x8e\xdb\x8a'
+W64_DATA_GUID = b'data\xf3\xac\xd3\x11\x8c\xd1\x00\xc0\x4f\x8e\xdb\x8a'
+
+# Коды формата в фрагменте fmt
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+KSDATAFORMAT_SUBTYPE_PCM = b'\x01\x00\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
 
 
 class AudioProcessor:
     """Класс для обработки WAV аудиофайлов без внешних зависимостей"""
 
-    def __init__(self, file_path):
+    # Размер блока (в кадрах) для поблочной обработки
+    BLOCK_FRAMES = 65536
+
+    # Типы массивов для промежуточного представления сэмплов
+    PRECISIONS = {'float32': 'f', 'float64': 'd'}
+
+    DITHER_MODES = ('none', 'tpdf')
+
+    # Операции редактирования, которые записываются в журнал сессии
+    JOURNALED_OPERATIONS = ('trim', 'change_volume', 'change_channel_volume', 'mute_channel', 'swap_channels')
+
+    def __init__(self, file_path, precision='float64', journal=None):
         """
         Инициализация процессора аудио
 
         Args:
             file_path (str): Путь к WAV файлу
+            precision (str): Точность промежуточной обработки ('float32' или 'float64')
+            journal (SessionJournal): Журнал, в который записываются операции
+                                      (начинается заново для этого файла)
         """
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Неизвестная точность: {precision}")
+
         self.file_path = file_path
+        self.precision = precision
+        self._mmap = None
+        self.journal = None
         self.load_wav(file_path)
         self.original_duration = self.get_duration()
 
+        if journal is not None:
+            journal.start(file_path, precision)
+            self.journal = journal
+
+    @classmethod
+    def recover(cls, journal):
+        """
+        Восстановление сессии по журналу
+
+        Записанные операции повторяются над исходным файлом, после чего
+        журнал продолжает вестись.
+
+        Args:
+            journal (SessionJournal): Журнал прерванной сессии
+
+        Returns:
+            AudioProcessor: Процессор с восстановленными изменениями
+        """
+        header, operations = journal.read()
+        if os.path.exists(header['source']):
+            stat = os.stat(header['source'])
+            if (stat.st_size, stat.st_mtime_ns) != (header['source_size'], header['source_mtime']):
+                raise ValueError("Исходный файл изменился после начала сессии")
+
+        processor = cls(header['source'], precision=header['precision'])
+
+        for operation, args in operations:
+            if operation not in cls.JOURNALED_OPERATIONS:
+                raise ValueError(f"Неизвестная операция в журнале: {operation}")
+            getattr(processor, operation)(*args)
+
+        processor.journal = journal
+        return processor
+
+    def _record(self, operation, *args):
+        """Запись выполненной операции в журнал"""
+        if self.journal is not None:
+            self.journal.append(operation, args)
+
     def load_wav(self, file_path):
-        """Загрузка WAV файла"""
+        """
+        Загрузка WAV файла
+
+        Поддерживаются RIFF WAV, RF64 и Wave64. Файл отображается в память,
+        поэтому объём занимаемой памяти не зависит от размера файла.
+        """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Файл не найден: {file_path}")
 
         file_extension = os.path.splitext(file_path)[1].lower()
-        if file_extension != '.wav':
-            raise ValueError("Поддерживаются только WAV файлы!")
+        if file_extension not in SUPPORTED_EXTENSIONS:
+            raise ValueError("Поддерживаются только WAV файлы (WAV, RF64, W64)!")
+
+        with open(file_path, 'rb') as wav_file:
+            data_offset, data_size = self._parse_header(wav_file)
+            file_size = os.fstat(wav_file.fileno()).st_size
+            self._mmap = mmap.mmap(wav_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._get_sample_format(self.sample_width)
+
+        # Размер из заголовка может превышать размер файла (файл обрезан)
+        block_align = self.sample_width * self.channels
+        data_size = max(min(data_size, file_size - data_offset), 0)
+        self.n_frames = data_size // block_align
+
+        # Исходные сэмплы не изменяются: обрезка сдвигает окно просмотра,
+        # громкость накапливается в self.gain и применяется при чтении блоков
+        self.frames = memoryview(self._mmap)[data_offset:data_offset + self.n_frames * block_align]
+        self._frames_offset = data_offset
+        self.gain = 1.0
+
+        # Для каждого выходного канала: номер исходного канала и его коэффициент
+        self.channel_map = list(range(self.channels))
+        self.channel_gains = [1.0] * self.channels
+
+    def _parse_header(self, wav_file):
+        """
+        Разбор заголовка RIFF / RF64 / Wave64
 
-        with wave.open(file_path, 'rb') as wav_file:
-            self.channels = wav_file.getnchannels()
-            self.sample_width = wav_file.getsampwidth()
-            self.frame_rate = wav_file.getframerate()
-            self.n_frames = wav_file.getnframes()
-            self.frames = wav_file.readframes(self.n_frames)
+        Заполняет параметры формата и возвращает положение данных.
+
+        Args:
+            wav_file (file): Файл, открытый на чтение в двоичном режиме
+
+        Returns:
+            tuple: (смещение данных, размер данных в байтах)
+        """
+        header = wav_file.read(16)
+        if header[:4] in (b'RIFF', b'RF64') and header[8:12] == b'WAVE':
+            is_w64 = False
+            wav_file.seek(12)
+        elif header == W64_RIFF_GUID:
+            wav_file.seek(24)
+            if wav_file.read(16) != W64_WAVE_GUID:
+                raise ValueError("Файл не является файлом Wave64")
+            is_w64 = True
+        else:
+            raise ValueError("Файл не является WAV файлом")
+
+        ds64_data_size = None
+        fmt_found = False
+
+        while True:
+            chunk_start = wav_file.tell()
+            if is_w64:
+                chunk_header = wav_file.read(24)
+                if len(chunk_header) < 24:
+                    break
+                chunk_id = chunk_header[:16]
+                # Размер в Wave64 включает 24 байта заголовка фрагмента
+                chunk_size = struct.unpack('<Q', chunk_header[16:])[0] - 24
+                next_chunk = chunk_start + 24 + chunk_size + (-chunk_size % 8)
+            else:
+                chunk_header = wav_file.read(8)
+                if len(chunk_header) < 8:
+                    break
+                chunk_id = chunk_header[:4]
+                chunk_size = struct.unpack('<I', chunk_header[4:])[0]
+                next_chunk = chunk_start + 8 + chunk_size + chunk_size % 2
+
+            if chunk_id == b'ds64':
+                ds64_data_size = struct.unpack('<QQ', wav_file.read(16))[1]
+            elif chunk_id in (b'fmt ', W64_FMT_GUID):
+                self._parse_fmt(wav_file.read(chunk_size))
+                fmt_found = True
+            elif chunk_id in (b'data', W64_DATA_GUID):
+                if not fmt_found:
+                    raise ValueError("Фрагмент fmt отсутствует перед данными")
+                data_offset = wav_file.tell()
+                if chunk_size == 0xFFFFFFFF and ds64_data_size is not None:
+                    chunk_size = ds64_data_size
+                elif not is_w64 and self._is_truncated_riff_size(wav_file, data_offset, chunk_size):
+                    chunk_size = os.fstat(wav_file.fileno()).st_size - data_offset
+                return data_offset, chunk_size
+
+            wav_file.seek(next_chunk)
+
+        raise ValueError("В файле нет аудиоданных")
+
+    @staticmethod
+    def _is_truncated_riff_size(wav_file, data_offset, data_size):
+        """
+        Проверка 32-битного размера фрагмента data у RIFF больше 4 ГБ
+
+        Такие файлы записывают с размером 0xFFFFFFFF без ds64 или с
+        переполненным размером. Данные в них - последний фрагмент, поэтому
+        если после объявленного конца нет корректного заголовка фрагмента,
+        данные читаются до конца файла.
+
+        Returns:
+            bool: Нужно ли читать данные до конца файла
+        """
+        remaining = os.fstat(wav_file.fileno()).st_size - data_offset
+        if remaining <= data_size:
+            return False
+        if data_size != 0xFFFFFFFF and remaining <= 0xFFFFFFFF:
+            # Файл помещается в 32-битные размеры: переполнения быть не могло
+            return False
+
+        wav_file.seek(data_offset + data_size + data_size % 2)
+        chunk_header = wav_file.read(8)
+        if len(chunk_header) < 8:
+            return True
+        chunk_id = chunk_header[:4]
+        chunk_size = struct.unpack('<I', chunk_header[4:])[0]
+        is_chunk = (
+            all(32 <= byte < 127 for byte in chunk_id)
+            and wav_file.tell() + chunk_size <= data_offset + remaining
+        )
+        return not is_chunk
+
+    def _parse_fmt(self, fmt_chunk):
+        """Разбор фрагмента fmt (PCM и WAVE_FORMAT_EXTENSIBLE)"""
+        if len(fmt_chunk) < 16:
+            raise ValueError("Повреждённый фрагмент fmt")
+
+        format_tag, channels, frame_rate, _, block_align, bits = struct.unpack('<HHIIHH', fmt_chunk[:16])
+        if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt_chunk) >= 26:
+            # Первые два байта GUID подформата совпадают с кодом формата
+            format_tag = struct.unpack('<H', fmt_chunk[24:26])[0]
+        if format_tag != WAVE_FORMAT_PCM:
+            raise ValueError("Поддерживаются только несжатые PCM файлы")
+        if channels == 0 or block_align % channels:
+            raise ValueError("Повреждённый фрагмент fmt")
+
+        self.channels = channels
+        self.frame_rate = frame_rate
+        self.sample_width = block_align // channels
+
+    def close(self):
+        """Освобождение отображённого в память файла"""
+        self.frames = memoryview(b'')
+        self.n_frames = 0
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Буфер ещё читается другим потоком, отображение освободит сборщик мусора
+                pass
+            self._mmap = None
+
+    def _remap_source(self, frames_offset, n_frames):
+        """
+        Повторное отображение исходного файла с сохранением изменений
+
+        Args:
+            frames_offset (int): Смещение окна просмотра в файле в байтах
+            n_frames (int): Количество кадров в окне просмотра
+        """
+        gain, channel_map, channel_gains = self.gain, self.channel_map, self.channel_gains
+        self.load_wav(self.file_path)
+
+        bytes_per_frame = self.sample_width * self.channels
+        self.frames = memoryview(self._mmap)[frames_offset:frames_offset + n_frames * bytes_per_frame]
+        self._frames_offset = frames_offset
+        self.n_frames = n_frames
+        self.gain, self.channel_map, self.channel_gains = gain, channel_map, channel_gains
 
     def get_duration(self):
         """Получить длительность в секундах"""
@@ -76,56 +321,412 @@ class AudioProcessor:
         start_byte = start_frame * bytes_per_frame
         end_byte = end_frame * bytes_per_frame
 
+        # Срез memoryview не копирует данные
         self.frames = self.frames[start_byte:end_byte]
+        self._frames_offset += start_byte
         self.n_frames = end_frame - start_frame
+        self._record('trim', start_sec, end_sec)
 
     def change_volume(self, db_change):
         """
         Изменение громкости
 
+        Коэффициенты перемножаются без округления, поэтому цепочка
+        изменений не накапливает ошибку квантования. Ограничение
+        по амплитуде выполняется только при сохранении.
+
         Args:
             db_change (float): Изменение в децибелах (+10 = громче, -10 = тише)
         """
         # Коэффициент изменения громкости
         factor = math.pow(10, db_change / 20.0)
+        self.gain *= factor
+        self._record('change_volume', db_change)
+
+    def _check_channel(self, channel):
+        """Проверка номера канала"""
+        if not 0 <= channel < self.channels:
+            raise ValueError(f"Номер канала должен быть от 0 до {self.channels - 1}")
+
+    def change_channel_volume(self, channel, db_change):
+        """
+        Изменение громкости одного канала
+
+        Args:
+            channel (int): Номер канала (с нуля)
+            db_change (float): Изменение в децибелах
+        """
+        self._check_channel(channel)
+        self.channel_gains[channel] *= math.pow(10, db_change / 20.0)
+        self._record('change_channel_volume', channel, db_change)
+
+    def mute_channel(self, channel):
+        """
+        Заглушение канала
+
+        Args:
+            channel (int): Номер канала (с нуля)
+        """
+        self._check_channel(channel)
+        self.channel_gains[channel] = 0.0
+        self._record('mute_channel', channel)
+
+    def swap_channels(self, first, second):
+        """
+        Перестановка двух каналов местами
 
-        # Определяем формат данных
-        fmt_map = {1: 'b', 2: 'h', 4: 'i'}
-        if self.sample_width not in fmt_map:
-            raise ValueError(f"Неподдерживаемая ширина сэмпла: {self.sample_width}")
+        Args:
+            first (int): Номер первого канала (с нуля)
+            second (int): Номер второго канала (с нуля)
+        """
+        self._check_channel(first)
+        self._check_channel(second)
+        self.channel_map[first], self.channel_map[second] = self.channel_map[second], self.channel_map[first]
+        self.channel_gains[first], self.channel_gains[second] = self.channel_gains[second], self.channel_gains[first]
+        self._record('swap_channels', first, second)
+
+    @staticmethod
+    def _get_sample_format(sample_width):
+        """Получить формат struct для одного сэмпла (8 бит в WAV беззнаковые)"""
+        fmt_map = {1: 'B', 2: 'h', 4: 'i'}
+        if sample_width not in fmt_map:
+            raise ValueError(f"Неподдерживаемая ширина сэмпла: {sample_width}")
+        return fmt_map[sample_width]
+
+    def _source_view(self, start_frame, count):
+        """
+        Целочисленное представление фрагмента исходного буфера без копирования
+
+        Args:
+            start_frame (int): Номер первого кадра
+            count (int): Количество кадров (обрезается по концу файла)
+
+        Returns:
+            memoryview: Чередующиеся по каналам сэмплы
+        """
+        start_frame = max(start_frame, 0)
+        count = max(min(count, self.n_frames - start_frame), 0)
+
+        fmt = self._get_sample_format(self.sample_width)
+        bytes_per_frame = self.sample_width * self.channels
+        raw = self.frames[start_frame * bytes_per_frame:(start_frame + count) * bytes_per_frame]
+
+        if sys.byteorder != 'little' and self.sample_width > 1:
+            # WAV хранит сэмплы в little-endian: на других платформах нужна копия
+            samples = array(fmt, raw)
+            samples.byteswap()
+            return memoryview(samples)
+        return raw.cast(fmt)
+
+    def _channel_samples(self, view, channel):
+        """
+        Сэмплы одного выходного канала
+
+        Читаются через срез с шагом по чередующемуся буферу, без
+        промежуточного разделения каналов.
+
+        Args:
+            view (memoryview): Результат _source_view
+            channel (int): Номер выходного канала
+
+        Returns:
+            array: Сэмплы канала с применённым изменением громкости
+        """
+        full_scale = 2 ** (8 * self.sample_width - 1)
+        offset = full_scale if self.sample_width == 1 else 0
+        scale = self.gain * self.channel_gains[channel] / full_scale
+        source = view[self.channel_map[channel]::self.channels]
+        return array(self.PRECISIONS[self.precision], [(s - offset) * scale for s in source])
+
+    def _exact_channel_samples(self, view, channel, sample_width):
+        """
+        Точные целые сэмплы канала, если повторное квантование не нужно
+
+        Заглушённый канал даёт цифровую тишину при любой разрядности.
+        Канал с единичным коэффициентом и прежней разрядностью берётся
+        из целочисленного исходного буфера и остаётся побитово точным.
+        Взаимно компенсирующие изменения громкости дают 1.0 с точностью
+        до округления, поэтому сравнение выполняется с допуском.
+
+        Args:
+            view (memoryview): Результат _source_view
+            channel (int): Номер выходного канала
+            sample_width (int): Ширина выходного сэмпла в байтах
+
+        Returns:
+            Последовательность знаковых сэмплов канала или None,
+            если канал нужно квантовать с дизерингом
+        """
+        total_gain = self.gain * self.channel_gains[channel]
+        if total_gain == 0.0:
+            return [0] * (len(view) // self.channels)
+
+        if sample_width == self.sample_width and math.isclose(total_gain, 1.0, rel_tol=1e-12):
+            source = view[self.channel_map[channel]::self.channels]
+            if self.sample_width == 1:
+                return [s - 128 for s in source]
+            return source
+        return None
+
+    def _has_channel_changes(self):
+        """Есть ли изменения отдельных каналов"""
+        return (
+            self.channel_map != list(range(self.channels))
+            or any(gain != 1.0 for gain in self.channel_gains)
+        )
+
+    def read_block(self, start_frame, count):
+        """
+        Чтение блока сэмплов в представлении с плавающей точкой
+
+        Args:
+            start_frame (int): Номер первого кадра
+            count (int): Количество кадров (обрезается по концу файла)
+
+        Returns:
+            array: Чередующиеся по каналам сэмплы в диапазоне [-1, 1)
+                   с применённым изменением громкости
+        """
+        view = self._source_view(start_frame, count)
 
-        fmt = fmt_map[self.sample_width]
-        num_samples = len(self.frames) // self.sample_width
+        if not self._has_channel_changes():
+            full_scale = 2 ** (8 * self.sample_width - 1)
+            offset = full_scale if self.sample_width == 1 else 0
+            scale = self.gain / full_scale
+            return array(self.PRECISIONS[self.precision], [(s - offset) * scale for s in view])
 
-        # Распаковываем байты в список значений
-        samples = list(struct.unpack(f'{num_samples}{fmt}', self.frames))
+        block = array(self.PRECISIONS[self.precision], [0.0]) * len(view)
+        for channel in range(self.channels):
+            block[channel::self.channels] = self._channel_samples(view, channel)
+        return block
 
-        # Максимальное значение для данной разрядности
-        max_val = 2 ** (8 * self.sample_width - 1) - 1
-        min_val = -max_val - 1
+    def iter_blocks(self, block_frames=None):
+        """
+        Последовательное чтение всего аудио блоками
+
+        Args:
+            block_frames (int): Размер блока в кадрах (по умолчанию BLOCK_FRAMES)
+
+        Yields:
+            array: Блоки сэмплов (см. read_block)
+        """
+        block_frames = block_frames or self.BLOCK_FRAMES
+        for start in range(0, self.n_frames, block_frames):
+            yield self.read_block(start, block_frames)
+
+    def read_mono(self, start_frame, count):
+        """
+        Чтение фрагмента аудио, сведённого в моно
+
+        Кадры за пределами файла дополняются нулями.
 
-        # Применяем изменение громкости с ограничением
-        samples = [int(max(min(s * factor, max_val), min_val)) for s in samples]
+        Args:
+            start_frame (int): Номер первого кадра
+            count (int): Количество кадров
+
+        Returns:
+            list: Значения сэмплов в диапазоне [-1, 1]
+        """
+        padding_before = min(max(-start_frame, 0), count)
+        samples = self.read_block(start_frame + padding_before, count - padding_before)
+
+        if self.channels == 1:
+            mono = list(samples)
+        else:
+            scale = 1.0 / self.channels
+            mono = [sum(frame) * scale for frame in zip(*[samples[c::self.channels] for c in range(self.channels)])]
 
-        # Упаковываем обратно в байты
-        self.frames = struct.pack(f'{len(samples)}{fmt}', *samples)
+        mono[:0] = [0.0] * padding_before
+        mono.extend([0.0] * (count - len(mono)))
+        return mono
 
-    def save(self, output_path):
+    def _encode_block(self, block, sample_width, dither, noise_shaping, errors, rng, exact_channels=None):
+        """
+        Преобразование блока в целочисленный PCM
+
+        Args:
+            block (array): Чередующиеся сэмплы с плавающей точкой
+            sample_width (int): Ширина выходного сэмпла в байтах
+            dither (str): Режим дизеринга ('none' или 'tpdf')
+            noise_shaping (bool): Формирование спектра шума ошибкой первого порядка
+            errors (list): Ошибки квантования по каналам, переносятся между блоками
+                           (их количество задаёт число каналов в блоке)
+            rng (random.Random): Генератор для дизеринга
+            exact_channels (list): Для каждого канала результат _exact_channel_samples:
+                                   такие сэмплы записываются как есть, без дизеринга
+
+        Returns:
+            bytes: Упакованные сэмплы
+        """
+        full_scale = 2 ** (8 * sample_width - 1)
+        max_val = full_scale - 1
+        min_val = -full_scale
+        channels = len(errors)
+        tpdf = dither == 'tpdf'
+        rand = rng.random
+        exact = exact_channels or [None] * channels
+
+        samples = [0] * len(block)
+        for i, value in enumerate(block):
+            exact_samples = exact[i % channels]
+            if exact_samples is not None:
+                samples[i] = exact_samples[i // channels]
+                continue
+            value *= full_scale
+            if noise_shaping:
+                value -= errors[i % channels]
+            # TPDF: разность двух равномерных шумов, амплитуда ±1 младший разряд
+            noise = rand() - rand() if tpdf else 0.0
+            quantized = int(math.floor(value + noise + 0.5))
+            if noise_shaping:
+                # Ошибка берётся до ограничения амплитуды: иначе перегрузка
+                # накапливается в обратной связи и продолжается после клиппинга
+                errors[i % channels] = quantized - value
+            samples[i] = max(min(quantized, max_val), min_val)
+
+        return self._pack_samples(samples, sample_width)
+
+    def _pack_samples(self, samples, sample_width):
+        """Упаковка знаковых целых сэмплов в байты WAV"""
+        fmt = self._get_sample_format(sample_width)
+        if sample_width == 1:
+            samples = [s + 128 for s in samples]
+        return struct.pack(f'<{len(samples)}{fmt}', *samples)
+
+    def save(self, output_path, sample_width=None, dither='tpdf', noise_shaping=False):
         """
         Сохранение аудио в WAV файл
 
+        Формат выбирается по расширению: .w64 - Wave64, иначе RIFF WAV,
+        который автоматически становится RF64 при превышении 4 ГБ.
+        Данные обрабатываются блоками по BLOCK_FRAMES кадров. Если аудио
+        не изменялось и разрядность та же, сэмплы копируются без
+        повторного квантования.
+
+        При сохранении поверх исходного файла его отображение в память
+        освобождается перед заменой (на Windows заменить отображённый файл
+        нельзя), после чего сохранённый файл становится новым исходным.
+
         Args:
             output_path (str): Путь для сохранения
+            sample_width (int): Ширина сэмпла в байтах (по умолчанию исходная)
+            dither (str): Режим дизеринга при квантовании ('none' или 'tpdf')
+            noise_shaping (bool): Сдвигать шум квантования в область высоких частот
+        """
+        sample_width = sample_width or self.sample_width
+        self._get_sample_format(sample_width)
+        if dither not in self.DITHER_MODES:
+            raise ValueError(f"Неизвестный режим дизеринга: {dither}")
+
+        output_path = self._get_output_path(output_path)
+
+        bytes_per_frame = self.sample_width * self.channels
+        # Взаимно компенсирующие изменения громкости дают 1.0 с точностью до округления
+        lossless = (
+            math.isclose(self.gain, 1.0, rel_tol=1e-12)
+            and sample_width == self.sample_width
+            and not self._has_channel_changes()
+        )
+
+        rng = random.Random()
+        errors = [0.0] * self.channels
+
+        overwrite_source = os.path.exists(output_path) and os.path.samefile(output_path, self.file_path)
+
+        wav_file = WavWriter(output_path, self.channels, sample_width, self.frame_rate)
+        try:
+            for start in range(0, self.n_frames, self.BLOCK_FRAMES):
+                if lossless:
+                    end = min(start + self.BLOCK_FRAMES, self.n_frames)
+                    wav_file.write_frames(self.frames[start * bytes_per_frame:end * bytes_per_frame])
+                else:
+                    view = self._source_view(start, self.BLOCK_FRAMES)
+                    exact_channels = [
+                        self._exact_channel_samples(view, channel, sample_width)
+                        for channel in range(self.channels)
+                    ]
+                    block = self.read_block(start, self.BLOCK_FRAMES)
+                    wav_file.write_frames(
+                        self._encode_block(block, sample_width, dither, noise_shaping, errors, rng, exact_channels)
+                    )
+        except Exception:
+            wav_file.discard()
+            raise
+
+        if not overwrite_source:
+            wav_file.close()
+            return
+
+        frames_offset, n_frames = self._frames_offset, self.n_frames
+        try:
+            wav_file.close(before_replace=self.close)
+        except Exception:
+            # Исходный файл не заменён: отображаем его снова вместе с изменениями
+            self._remap_source(frames_offset, n_frames)
+            raise
+
+        # Все изменения уже записаны в новый исходный файл, поэтому журнал
+        # начинается заново: иначе восстановление применило бы их повторно
+        self.load_wav(self.file_path)
+        if self.journal is not None:
+            self.journal.start(self.file_path, self.precision)
+
+    def extract_channels(self, output_paths, channels=None, sample_width=None, dither='tpdf', noise_shaping=False):
+        """
+        Извлечение каналов в отдельные моно файлы за один проход
+
+        Args:
+            output_paths (list): Пути для сохранения, по одному на канал
+            channels (list): Номера извлекаемых каналов (по умолчанию все)
+            sample_width (int): Ширина сэмпла в байтах (по умолчанию исходная)
+            dither (str): Режим дизеринга при квантовании ('none' или 'tpdf')
+            noise_shaping (bool): Сдвигать шум квантования в область высоких частот
         """
+        channels = list(range(self.channels)) if channels is None else list(channels)
+        if len(output_paths) != len(channels):
+            raise ValueError("Количество путей должно совпадать с количеством каналов")
+        for channel in channels:
+            self._check_channel(channel)
+
+        sample_width = sample_width or self.sample_width
+        self._get_sample_format(sample_width)
+        if dither not in self.DITHER_MODES:
+            raise ValueError(f"Неизвестный режим дизеринга: {dither}")
+
+        rng = random.Random()
+        errors = [[0.0] for _ in channels]
+        writers = []
+        try:
+            for output_path in output_paths:
+                writers.append(WavWriter(self._get_output_path(output_path), 1, sample_width, self.frame_rate))
+
+            for start in range(0, self.n_frames, self.BLOCK_FRAMES):
+                view = self._source_view(start, self.BLOCK_FRAMES)
+                for index, channel in enumerate(channels):
+                    # Неизменённые и заглушённые каналы копируются без преобразования в float
+                    exact_samples = self._exact_channel_samples(view, channel, sample_width)
+                    if exact_samples is not None:
+                        writers[index].write_frames(self._pack_samples(exact_samples, sample_width))
+                        continue
+                    block = self._channel_samples(view, channel)
+                    writers[index].write_frames(
+                        self._encode_block(block, sample_width, dither, noise_shaping, errors[index], rng)
+                    )
+        except Exception:
+            for writer in writers:
+                writer.discard()
+            raise
+
+        for writer in writers:
+            writer.close()
+
+    @staticmethod
+    def _get_output_path(output_path):
+        """Добавление расширения .wav, если оно не поддерживается"""
         file_extension = os.path.splitext(output_path)[1].lower()
-        if file_extension != '.wav':
+        if file_extension not in SUPPORTED_EXTENSIONS:
             output_path += '.wav'
-
-        with wave.open(output_path, 'wb') as wav_file:
-            wav_file.setnchannels(self.channels)
-            wav_file.setsampwidth(self.sample_width)
-            wav_file.setframerate(self.frame_rate)
-            wav_file.writeframes(self.frames)
+        return output_path
 
     def get_audio_info(self):
         """Получить информацию об аудио"""
@@ -139,6 +740,610 @@ class AudioProcessor:
         }
 
 
+class WavWriter:
+    """Потоковая запись WAV / RF64 / Wave64"""
+
+    # Максимальный размер, который помещается в 32-битные поля RIFF
+    RIFF_LIMIT = 0xFFFFFFFF
+
+    def __init__(self, file_path, channels, sample_width, frame_rate):
+        """
+        Открытие файла и запись заголовка
+
+        Размеры в заголовке заполняются при закрытии. В RIFF WAV
+        резервируется фрагмент JUNK, который заменяется на ds64,
+        если файл превысит 4 ГБ.
+
+        Данные пишутся во временный файл рядом с целевым, который
+        переименовывается в file_path только после успешного закрытия.
+        Поэтому при сбое прежний файл (в том числе исходный, отображённый
+        в память) остаётся целым.
+
+        Args:
+            file_path (str): Путь к файлу (.w64 - формат Wave64)
+            channels (int): Количество каналов
+            sample_width (int): Ширина сэмпла в байтах
+            frame_rate (int): Частота дискретизации в Гц
+        """
+        self.channels = channels
+        self.sample_width = sample_width
+        self.frame_rate = frame_rate
+        self.file_path = file_path
+        self.is_w64 = os.path.splitext(file_path)[1].lower() == '.w64'
+        self.data_size = 0
+
+        self._temp_path = file_path + '.tmp'
+        self._file = open(self._temp_path, 'wb')
+        try:
+            self._write_header()
+        except Exception:
+            self.discard()
+            raise
+
+    def _make_fmt(self):
+        """Содержимое фрагмента fmt"""
+        block_align = self.channels * self.sample_width
+        bits = self.sample_width * 8
+        # Многоканальные и высокоразрядные файлы по спецификации используют EXTENSIBLE
+        extensible = self.channels > 2 or bits > 16
+        fmt_chunk = struct.pack(
+            '<HHIIHH',
+            WAVE_FORMAT_EXTENSIBLE if extensible else WAVE_FORMAT_PCM,
+            self.channels,
+            self.frame_rate,
+            self.frame_rate * block_align,
+            block_align,
+            bits
+        )
+        if extensible:
+            fmt_chunk += struct.pack('<HHI', 22, bits, 0) + KSDATAFORMAT_SUBTYPE_PCM
+        return fmt_chunk
+
+    def _write_header(self):
+        """Запись заголовка с незаполненными размерами"""
+        fmt_chunk = self._make_fmt()
+        if self.is_w64:
+            fmt_chunk += b'\x00' * (-len(fmt_chunk) % 8)
+            self._file.write(W64_RIFF_GUID + struct.pack('<Q', 0) + W64_WAVE_GUID)
+            self._file.write(W64_FMT_GUID + struct.pack('<Q', 24 + len(fmt_chunk)) + fmt_chunk)
+            self._file.write(W64_DATA_GUID + struct.pack('<Q', 0))
+        else:
+            self._file.write(b'RIFF' + struct.pack('<I', 0) + b'WAVE')
+            # Место под ds64: размер RIFF, размер данных, число кадров, длина таблицы
+            self._file.write(b'JUNK' + struct.pack('<I', 28) + b'\x00' * 28)
+            self._file.write(b'fmt ' + struct.pack('<I', len(fmt_chunk)) + fmt_chunk)
+            self._file.write(b'data' + struct.pack('<I', 0))
+        self._data_offset = self._file.tell()
+
+    def write_frames(self, data):
+        """
+        Запись блока кадров
+
+        Args:
+            data (bytes): Упакованные сэмплы
+        """
+        self._file.write(data)
+        self.data_size += len(data)
+
+    def close(self, before_replace=None):
+        """
+        Заполнение размеров в заголовке, закрытие и переименование файла
+
+        Args:
+            before_replace (callable): Вызывается перед переименованием
+                                       (например, чтобы освободить отображение
+                                       заменяемого файла в память)
+        """
+        if self._file is None:
+            return
+
+        try:
+            padding = -self.data_size % 8 if self.is_w64 else self.data_size % 2
+            self._file.write(b'\x00' * padding)
+            file_size = self._data_offset + self.data_size + padding
+
+            if self.is_w64:
+                self._file.seek(16)
+                self._file.write(struct.pack('<Q', file_size))
+                self._file.seek(self._data_offset - 8)
+                self._file.write(struct.pack('<Q', self.data_size + 24))
+            elif file_size - 8 <= self.RIFF_LIMIT:
+                self._file.seek(4)
+                self._file.write(struct.pack('<I', file_size - 8))
+                self._file.seek(self._data_offset - 4)
+                self._file.write(struct.pack('<I', self.data_size))
+            else:
+                n_frames = self.data_size // (self.channels * self.sample_width)
+                self._file.seek(0)
+                self._file.write(b'RF64' + struct.pack('<I', 0xFFFFFFFF) + b'WAVE')
+                self._file.write(b'ds64' + struct.pack('<I', 28))
+                self._file.write(struct.pack('<QQQI', file_size - 8, self.data_size, n_frames, 0))
+                self._file.seek(self._data_offset - 4)
+                self._file.write(struct.pack('<I', 0xFFFFFFFF))
+
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception:
+            self.discard()
+            raise
+
+        self._file.close()
+        self._file = None
+        try:
+            if before_replace is not None:
+                before_replace()
+            os.replace(self._temp_path, self.file_path)
+        except Exception:
+            self.discard()
+            raise
+
+    def discard(self):
+        """Закрытие и удаление незавершённого файла"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class SessionJournal:
+    """Журнал операций сессии для восстановления после сбоя"""
+
+    JOURNAL_EXTENSION = '.journal'
+
+    def __init__(self, journal_path):
+        """
+        Args:
+            journal_path (str): Путь к файлу журнала
+        """
+        self.journal_path = journal_path
+
+    @classmethod
+    def for_source(cls, source_path):
+        """Журнал по умолчанию для исходного файла (рядом с ним)"""
+        return cls(source_path + cls.JOURNAL_EXTENSION)
+
+    def exists(self):
+        """Есть ли незавершённая сессия"""
+        return os.path.exists(self.journal_path)
+
+    def start(self, source_path, precision):
+        """
+        Начало новой сессии
+
+        Журнал хранит только ссылку на исходный файл и параметры операций,
+        аудиоданные в него не копируются.
+
+        Args:
+            source_path (str): Путь к исходному файлу
+            precision (str): Точность промежуточной обработки
+        """
+        stat = os.stat(source_path)
+        header = {
+            'source': os.path.abspath(source_path),
+            'source_size': stat.st_size,
+            'source_mtime': stat.st_mtime_ns,
+            'precision': precision,
+        }
+        temp_path = self.journal_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as journal_file:
+            journal_file.write(json.dumps(header, ensure_ascii=False) + '\n')
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        os.replace(temp_path, self.journal_path)
+
+    def append(self, operation, args):
+        """
+        Дозапись операции в журнал
+
+        Args:
+            operation (str): Имя метода AudioProcessor
+            args (tuple): Аргументы вызова
+        """
+        line = json.dumps({'op': operation, 'args': list(args)})
+        with open(self.journal_path, 'a', encoding='utf-8') as journal_file:
+            journal_file.write(line + '\n')
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def read(self):
+        """
+        Чтение журнала
+
+        Недописанная последняя строка (сбой во время записи) отбрасывается
+        и обрезается в файле, чтобы следующие записи начинались с новой строки.
+
+        Returns:
+            tuple: (заголовок сессии, список пар (операция, аргументы))
+        """
+        with open(self.journal_path, 'rb') as journal_file:
+            data = journal_file.read()
+
+        lines = data.split(b'\n')
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            raise ValueError("Журнал сессии повреждён")
+
+        operations = []
+        valid_size = len(lines[0]) + 1
+        # Последний элемент после split - текст после последнего перевода строки
+        for line in lines[1:-1]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            operations.append((entry['op'], entry['args']))
+            valid_size += len(line) + 1
+
+        if valid_size < len(data):
+            with open(self.journal_path, 'r+b') as journal_file:
+                journal_file.truncate(valid_size)
+
+        return header, operations
+
+    def archive(self):
+        """
+        Переименование журнала в резервную копию, чтобы не потерять его
+        при начале новой сессии
+
+        Returns:
+            str: Путь к резервной копии
+        """
+        index = 1
+        while os.path.exists(f"{self.journal_path}.{index}.bak"):
+            index += 1
+        backup_path = f"{self.journal_path}.{index}.bak"
+        os.replace(self.journal_path, backup_path)
+        return backup_path
+
+    def remove(self):
+        """Удаление журнала при штатном завершении сессии"""
+        if self.exists():
+            os.remove(self.journal_path)
+
+
+class SpectrumAnalyzer:
+    """STFT-анализатор для построения спектрограммы"""
+
+    WINDOWS = ('hann', 'hamming', 'rectangular')
+
+    def __init__(self, audio_processor, fft_size=1024, hop_size=256, window='hann'):
+        """
+        Инициализация анализатора
+
+        Args:
+            audio_processor (AudioProcessor): Источник аудиоданных
+            fft_size (int): Размер окна БПФ (степень двойки)
+            hop_size (int): Шаг между соседними окнами в кадрах
+            window (str): Оконная функция ('hann', 'hamming', 'rectangular')
+        """
+        if fft_size < 16 or fft_size & (fft_size - 1):
+            raise ValueError("Размер БПФ должен быть степенью двойки не меньше 16")
+        if not 0 < hop_size <= fft_size:
+            raise ValueError("Шаг окна должен быть от 1 до размера БПФ")
+        if window not in self.WINDOWS:
+            raise ValueError(f"Неизвестная оконная функция: {window}")
+
+        self.audio_processor = audio_processor
+        self.fft_size = fft_size
+        self.hop_size = hop_size
+        self.window_name = window
+
+        # Таблицы считаются один раз и переиспользуются для каждого окна
+        self.window = self._make_window(window, fft_size)
+        self._bit_reverse = self._make_bit_reverse(fft_size)
+        self._twiddles = [cmath.exp(-2j * math.pi * k / fft_size) for k in range(fft_size // 2)]
+        self._db_offset = 20 * math.log10(sum(self.window) / 2)
+
+    @staticmethod
+    def _make_window(name, size):
+        """Построение оконной функции"""
+        if name == 'hann':
+            return [0.5 - 0.5 * math.cos(2 * math.pi * n / size) for n in range(size)]
+        if name == 'hamming':
+            return [0.54 - 0.46 * math.cos(2 * math.pi * n / size) for n in range(size)]
+        return [1.0] * size
+
+    @staticmethod
+    def _make_bit_reverse(size):
+        """Построение перестановки бит-реверса для БПФ"""
+        bits = size.bit_length() - 1
+        return [int(format(i, f'0{bits}b')[::-1], 2) for i in range(size)]
+
+    def get_bin_count(self):
+        """Получить количество частотных полос"""
+        return self.fft_size // 2 + 1
+
+    def get_frequencies(self):
+        """Получить центральные частоты полос в Гц"""
+        rate = self.audio_processor.get_sample_rate()
+        return [k * rate / self.fft_size for k in range(self.get_bin_count())]
+
+    def get_column_count(self, step=None):
+        """
+        Получить количество столбцов спектрограммы
+
+        Args:
+            step (int): Расстояние между столбцами в кадрах (по умолчанию hop_size)
+        """
+        step = step or self.hop_size
+        return -(-self.audio_processor.n_frames // step)
+
+    def _fft(self, values):
+        """Итеративное БПФ по основанию 2 для вещественного окна"""
+        n = self.fft_size
+        data = [complex(values[i]) for i in self._bit_reverse]
+
+        size = 2
+        while size <= n:
+            half = size // 2
+            stride = n // size
+            twiddles = self._twiddles[::stride]
+            for start in range(0, n, size):
+                for k in range(half):
+                    even = data[start + k]
+                    odd = data[start + k + half] * twiddles[k]
+                    data[start + k] = even + odd
+                    data[start + k + half] = even - odd
+            size *= 2
+
+        return data
+
+    def _spectrum(self, samples):
+        """Амплитудный спектр окна в дБ относительно полной шкалы"""
+        windowed = [s * w for s, w in zip(samples, self.window)]
+        spectrum = self._fft(windowed)
+        return array('f', (
+            20 * math.log10(abs(x) + 1e-12) - self._db_offset
+            for x in spectrum[:self.get_bin_count()]
+        ))
+
+    def compute_column(self, index, step=None):
+        """
+        Вычисление одного столбца спектрограммы
+
+        Если шаг больше окна БПФ, весь интервал шага покрывается
+        соседними окнами, и по каждой полосе берётся максимум. Так
+        короткие переходные процессы и клиппинг видны на любом масштабе.
+        Окна читаются по одному, поэтому память не зависит от шага.
+
+        Args:
+            index (int): Номер столбца
+            step (int): Расстояние между столбцами в кадрах
+
+        Returns:
+            array: Уровни частотных полос в дБFS
+        """
+        step = step or self.hop_size
+        windows = max(-(-step // self.fft_size), 1)
+        start = index * step
+
+        column = self._spectrum(self.audio_processor.read_mono(start, self.fft_size))
+        for window in range(1, windows):
+            samples = self.audio_processor.read_mono(start + window * self.fft_size, self.fft_size)
+            column = array('f', map(max, column, self._spectrum(samples)))
+        return column
+
+    def compute_columns(self, first, count, step=None):
+        """
+        Вычисление диапазона столбцов спектрограммы
+
+        При перекрывающихся окнах фрагмент читается из буфера один раз.
+
+        Args:
+            first (int): Номер первого столбца
+            count (int): Количество столбцов
+            step (int): Расстояние между столбцами в кадрах
+
+        Returns:
+            list: Столбцы спектрограммы
+        """
+        step = step or self.hop_size
+        count = max(min(count, self.get_column_count(step) - first), 0)
+        if count == 0:
+            return []
+
+        if step > self.fft_size:
+            return [self.compute_column(first + i, step) for i in range(count)]
+
+        span = self.audio_processor.read_mono(first * step, (count - 1) * step + self.fft_size)
+        return [
+            self._spectrum(span[i * step:i * step + self.fft_size])
+            for i in range(count)
+        ]
+
+
+class SpectrogramTileCache:
+    """Кэш тайлов спектрограммы с вычислением в фоновом потоке"""
+
+    def __init__(self, analyzer, tile_width=128, max_tiles=64):
+        """
+        Инициализация кэша
+
+        Уровень масштаба zoom задаёт шаг столбцов hop_size * 2**zoom.
+        Пока шаг не больше окна БПФ, столбцы вычисляются напрямую и
+        покрывают все кадры. Тайлы более крупных уровней строятся из
+        двух тайлов предыдущего уровня: соседние столбцы объединяются
+        максимумом по полосам. Поэтому БПФ по файлу выполняется один раз,
+        а каждый следующий уровень стоит O(количество столбцов).
+
+        Args:
+            analyzer (SpectrumAnalyzer): Анализатор для вычисления тайлов
+            tile_width (int): Количество столбцов в одном тайле
+            max_tiles (int): Максимальное количество тайлов в памяти
+        """
+        self.analyzer = analyzer
+        self.tile_width = tile_width
+        self.max_tiles = max_tiles
+
+        self._tiles = OrderedDict()
+        self._pending = set()
+        # Тайлы, вычисление которых завершилось ошибкой (до сброса кэша)
+        self._failed = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        # Последние запрошенные тайлы (видимые сейчас) считаются первыми
+        self._requests = queue.LifoQueue()
+        self._stopped = threading.Event()
+
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def get_step(self, zoom):
+        """Получить шаг столбцов в кадрах для уровня масштаба"""
+        return self.analyzer.hop_size * 2 ** zoom
+
+    def get_column_count(self, zoom):
+        """Получить количество столбцов на уровне масштаба"""
+        return self.analyzer.get_column_count(self.get_step(zoom))
+
+    def get_tile_count(self, zoom):
+        """Получить количество тайлов на уровне масштаба"""
+        return -(-self.get_column_count(zoom) // self.tile_width)
+
+    def get_max_zoom(self):
+        """Получить самый мелкий уровень масштаба (весь файл в одном тайле)"""
+        zoom = 0
+        while self.get_tile_count(zoom) > 1:
+            zoom += 1
+        return zoom
+
+    def get_tile(self, zoom, index):
+        """
+        Получить тайл из кэша
+
+        Если тайла нет, он ставится в очередь на вычисление.
+
+        Args:
+            zoom (int): Уровень масштаба
+            index (int): Номер тайла
+
+        Returns:
+            list: Столбцы тайла или None, если тайл ещё не готов
+        """
+        key = (zoom, index)
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return self._tiles[key]
+            if key not in self._pending and key not in self._failed:
+                self._pending.add(key)
+                self._requests.put((self._generation, key))
+        return None
+
+    def has_pending(self):
+        """Есть ли тайлы в очереди на вычисление"""
+        with self._lock:
+            return bool(self._pending)
+
+    def get_errors(self):
+        """
+        Получить ошибки вычисления тайлов
+
+        Returns:
+            dict: {(zoom, номер тайла): текст ошибки}
+        """
+        with self._lock:
+            return dict(self._failed)
+
+    def invalidate(self):
+        """Сброс кэша после изменения аудио (ошибочные тайлы запрашиваются заново)"""
+        with self._lock:
+            self._generation += 1
+            self._tiles.clear()
+            self._pending.clear()
+            self._failed.clear()
+
+    def stop(self):
+        """Остановка фонового потока"""
+        self._stopped.set()
+        self._requests.put(None)
+
+    def _run(self):
+        """Цикл фонового потока"""
+        while not self._stopped.is_set():
+            request = self._requests.get()
+            if request is None:
+                break
+
+            generation, key = request
+            with self._lock:
+                if generation != self._generation or key not in self._pending:
+                    continue
+
+            zoom, index = key
+            try:
+                tile = self._build_tile(zoom, index, generation)
+            except Exception as e:
+                # Ошибочный тайл не кэшируется, ошибка передаётся интерфейсу
+                with self._lock:
+                    if generation == self._generation:
+                        self._pending.discard(key)
+                        self._failed[key] = str(e) or type(e).__name__
+                continue
+
+            if tile is None:
+                # Вычисление прервано остановкой или сбросом кэша
+                continue
+            self._store(generation, key, tile)
+
+    def _store(self, generation, key, tile):
+        """Сохранение готового тайла в кэш"""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._pending.discard(key)
+            self._tiles[key] = tile
+            self._tiles.move_to_end(key)
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+
+    def _build_tile(self, zoom, index, generation):
+        """
+        Вычисление тайла (в фоновом потоке)
+
+        Тайлы крупных уровней собираются из двух тайлов предыдущего
+        уровня, которые берутся из кэша или вычисляются рекурсивно.
+
+        Returns:
+            list: Столбцы тайла или None, если вычисление прервано
+        """
+        if self._stopped.is_set() or generation != self._generation:
+            return None
+
+        with self._lock:
+            if (zoom, index) in self._tiles:
+                return self._tiles[(zoom, index)]
+
+        if self.get_step(zoom) <= self.analyzer.fft_size:
+            return self.analyzer.compute_columns(index * self.tile_width, self.tile_width, self.get_step(zoom))
+
+        columns = []
+        for child in (2 * index, 2 * index + 1):
+            if child >= self.get_tile_count(zoom - 1):
+                break
+            child_tile = self._build_tile(zoom - 1, child, generation)
+            if child_tile is None:
+                return None
+            self._store(generation, (zoom - 1, child), child_tile)
+            columns.extend(child_tile)
+
+        return [
+            array('f', map(max, columns[i], columns[i + 1])) if i + 1 < len(columns) else columns[i]
+            for i in range(0, len(columns), 2)
+        ]
+
+
 class AudioRedactorGUI:
     """Графический интерфейс AudioRedactor"""
 
@@ -1,20 +1,22 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from tkinter import filedialog, messagebox, ttk, simpledialog
 import os
-from Audio_processor_Rassylshikov  import AudioProcessor
+from Audio_processor_Rassylshikov  import AudioProcessor, SessionJournal, SpectrumAnalyzer, SpectrogramTileCache
 
 
 class AudioRedactorGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("AudioRedactor - Простой аудиоредактор")
-        self.root.geometry("600x500")
+        self.root.geometry("600x680")
         self.root.resizable(False, False)
 
         self.audio_processor = None
         self.current_file_path = None
+        self.spectrogram_window = None
 
         self._create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def _create_widgets(self):
         """Создание элементов интерфейса"""
@@ -98,8 +100,48 @@ class AudioRedactorGUI:
         )
         volume_button.pack(side="right", padx=5)
 
+        # Фрейм для операций с каналами
+        channel_frame = tk.LabelFrame(self.root, text="4. Каналы", padx=10, pady=10)
+        channel_frame.pack(fill="x", padx=20, pady=10)
+
+        tk.Label(channel_frame, text="Канал:").pack(side="left", padx=5)
+
+        self.channel_var = tk.StringVar(value="1")
+        self.channel_spinbox = tk.Spinbox(channel_frame, from_=1, to=1, textvariable=self.channel_var, width=4)
+        self.channel_spinbox.pack(side="left", padx=5)
+
+        channel_buttons = [
+            ("Громкость (dB)", self.change_channel_volume),
+            ("Заглушить", self.mute_channel),
+            ("Поменять с...", self.swap_channels),
+            ("Извлечь каналы...", self.extract_channels),
+        ]
+        for text, command in channel_buttons:
+            tk.Button(
+                channel_frame,
+                text=text,
+                command=command,
+                bg="#607D8B",
+                fg="white",
+                padx=5
+            ).pack(side="left", padx=3)
+
+        # Фрейм для анализа
+        analysis_frame = tk.LabelFrame(self.root, text="5. Анализ", padx=10, pady=10)
+        analysis_frame.pack(fill="x", padx=20, pady=10)
+
+        spectrogram_button = tk.Button(
+            analysis_frame,
+            text="Спектрограмма...",
+            command=self.show_spectrogram,
+            bg="#009688",
+            fg="white",
+            padx=10
+        )
+        spectrogram_button.pack()
+
         # Фрейм для сохранения
-        save_frame = tk.LabelFrame(self.root, text="4. Сохранение результата", padx=10, pady=10)
+        save_frame = tk.LabelFrame(self.root, text="6. Сохранение результата", padx=10, pady=10)
         save_frame.pack(fill="x", padx=20, pady=10)
 
         save_button = tk.Button(
@@ -111,7 +153,20 @@ class AudioRedactorGUI:
             padx=20,
             pady=5
         )
-        save_button.pack()
+        save_button.pack(side="right")
+
+        tk.Label(save_frame, text="Разрядность:").pack(side="left")
+
+        self.bit_depth_var = tk.StringVar(value="Исходная")
+        bit_depth_menu = tk.OptionMenu(save_frame, self.bit_depth_var, "Исходная", "8", "16", "32")
+        bit_depth_menu.config(width=8)
+        bit_depth_menu.pack(side="left", padx=5)
+
+        self.dither_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(save_frame, text="Дизеринг (TPDF)", variable=self.dither_var).pack(side="left")
+
+        self.noise_shaping_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(save_frame, text="Формирование шума", variable=self.noise_shaping_var).pack(side="left")
 
         # Статус бар
         self.status_bar = tk.Label(
@@ -129,8 +184,9 @@ class AudioRedactorGUI:
         file_path = filedialog.askopenfilename(
             title="Выберите аудиофайл",
             filetypes=[
-                ("Аудио файлы", "*.wav *.mp3"),
+                ("Аудио файлы", "*.wav *.rf64 *.w64 *.mp3"),
                 ("WAV файлы", "*.wav"),
+                ("RF64 / Wave64 файлы", "*.rf64 *.w64"),
                 ("MP3 файлы", "*.mp3"),
                 ("Все файлы", "*.*")
             ]
@@ -138,7 +194,18 @@ class AudioRedactorGUI:
 
         if file_path:
             try:
-                self.audio_processor = AudioProcessor(file_path)
+                # Журнал уже открытого файла принадлежит текущей сессии, а не прерванной
+                reopening = (
+                    self.current_file_path is not None
+                    and os.path.exists(self.current_file_path)
+                    and os.path.samefile(file_path, self.current_file_path)
+                )
+                audio_processor, recovered = self._open_processor(file_path, check_journal=not reopening)
+                self._close_spectrogram()
+                if self.audio_processor:
+                    self._end_session(keep_journal=audio_processor.journal)
+
+                self.audio_processor = audio_processor
                 self.current_file_path = file_path
 
                 filename = os.path.basename(file_path)
@@ -151,15 +218,76 @@ class AudioRedactorGUI:
                 info_text = f"Длительность: {duration:.2f} сек | Каналы: {channels} | Частота: {sample_rate} Гц"
                 self.info_label.config(text=info_text)
 
+                self.channel_spinbox.config(to=channels)
+                self.channel_var.set("1")
+
                 # Установить конец по умолчанию
                 self.end_entry.delete(0, tk.END)
                 self.end_entry.insert(0, str(int(duration)))
 
-                self.status_bar.config(text=f"Загружен: {filename}")
+                if recovered:
+                    self.status_bar.config(text=f"Загружен: {filename} (сессия восстановлена из журнала)")
+                else:
+                    self.status_bar.config(text=f"Загружен: {filename}")
 
             except Exception as e:
                 messagebox.showerror("Ошибка", f"Не удалось загрузить файл:\n{str(e)}")
 
+    def _open_processor(self, file_path, check_journal=True):
+        """
+        Открытие файла с журналом сессии
+
+        Если для файла остался журнал прерванной сессии, предлагается
+        повторить записанные в нём операции. Если журнал не используется,
+        перед новой сессией он сохраняется как резервная копия.
+
+        Args:
+            file_path (str): Путь к файлу
+            check_journal (bool): Искать журнал прерванной сессии (False при
+                                  повторном открытии текущего файла: журнал
+                                  текущей сессии просто начинается заново)
+
+        Returns:
+            tuple: (AudioProcessor, была ли восстановлена сессия)
+        """
+        journal = SessionJournal.for_source(file_path)
+        if check_journal and journal.exists() and messagebox.askyesno(
+                "Восстановление сессии",
+                "Найден журнал незавершённой сессии для этого файла.\n\nВосстановить изменения?"
+        ):
+            try:
+                return AudioProcessor.recover(journal), True
+            except Exception as e:
+                messagebox.showerror("Ошибка", f"Не удалось восстановить сессию:\n{str(e)}")
+
+        if check_journal and journal.exists():
+            try:
+                backup_path = journal.archive()
+                messagebox.showinfo("Журнал сессии", f"Прежний журнал сохранён как:\n{backup_path}")
+            except OSError:
+                # Журнал нельзя переместить: не перезаписываем его и работаем без журнала
+                return AudioProcessor(file_path), False
+
+        try:
+            return AudioProcessor(file_path, journal=journal), False
+        except OSError:
+            # Папка с файлом недоступна для записи: работаем без журнала
+            return AudioProcessor(file_path), False
+
+    def _end_session(self, keep_journal=None):
+        """Штатное завершение сессии: удаление журнала и освобождение файла"""
+        journal = self.audio_processor.journal
+        if journal and not (keep_journal and keep_journal.journal_path == journal.journal_path):
+            journal.remove()
+        self.audio_processor.close()
+
+    def on_close(self):
+        """Закрытие приложения"""
+        self._close_spectrogram()
+        if self.audio_processor:
+            self._end_session()
+        self.root.destroy()
+
     def trim_audio(self):
         """Обрезка аудио"""
         if not self.audio_processor:
@@ -183,6 +311,8 @@ class AudioRedactorGUI:
                      f"Частота: {self.audio_processor.get_sample_rate()} Гц"
             )
 
+            self._refresh_spectrogram()
+
             self.status_bar.config(text=f"Обрезка выполнена: {start}с - {end}с")
             messagebox.showinfo("Успех", f"Аудио обрезано: {start}с - {end}с")
 
@@ -209,6 +339,8 @@ class AudioRedactorGUI:
 
             self.audio_processor.change_volume(db_change)
 
+            self._refresh_spectrogram()
+
             sign = "+" if db_change >= 0 else ""
             self.status_bar.config(text=f"Громкость изменена: {sign}{db_change} dB")
             messagebox.showinfo("Успех", f"Громкость изменена на {sign}{db_change} dB")
@@ -218,6 +350,134 @@ class AudioRedactorGUI:
         except Exception as e:
             messagebox.showerror("Ошибка", f"Не удалось изменить громкость:\n{str(e)}")
 
+    def _get_channel(self):
+        """Номер выбранного канала (с нуля)"""
+        return int(self.channel_var.get()) - 1
+
+    def change_channel_volume(self):
+        """Изменение громкости выбранного канала"""
+        if not self.audio_processor:
+            messagebox.showwarning("Предупреждение", "Сначала загрузите аудиофайл!")
+            return
+
+        try:
+            channel = self._get_channel()
+            db_change = float(self.volume_var.get())
+
+            if abs(db_change) > 50:
+                if not messagebox.askyesno(
+                        "Предупреждение",
+                        f"Изменение громкости на {db_change} dB может привести к искажениям. Продолжить?"
+                ):
+                    return
+
+            self.audio_processor.change_channel_volume(channel, db_change)
+            self._refresh_spectrogram()
+
+            sign = "+" if db_change >= 0 else ""
+            self.status_bar.config(text=f"Громкость канала {channel + 1} изменена: {sign}{db_change} dB")
+
+        except ValueError as e:
+            messagebox.showerror("Ошибка", f"Неверные значения!\n{str(e)}")
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось изменить громкость канала:\n{str(e)}")
+
+    def mute_channel(self):
+        """Заглушение выбранного канала"""
+        if not self.audio_processor:
+            messagebox.showwarning("Предупреждение", "Сначала загрузите аудиофайл!")
+            return
+
+        try:
+            channel = self._get_channel()
+            self.audio_processor.mute_channel(channel)
+            self._refresh_spectrogram()
+            self.status_bar.config(text=f"Канал {channel + 1} заглушён")
+
+        except ValueError as e:
+            messagebox.showerror("Ошибка", f"Неверный номер канала!\n{str(e)}")
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось заглушить канал:\n{str(e)}")
+
+    def swap_channels(self):
+        """Перестановка выбранного канала с другим"""
+        if not self.audio_processor:
+            messagebox.showwarning("Предупреждение", "Сначала загрузите аудиофайл!")
+            return
+
+        channels = self.audio_processor.get_channels()
+        other = simpledialog.askinteger(
+            "Перестановка каналов",
+            f"Поменять канал {self.channel_var.get()} с каналом (1-{channels}):",
+            parent=self.root,
+            minvalue=1,
+            maxvalue=channels
+        )
+        if other is None:
+            return
+
+        try:
+            channel = self._get_channel()
+            self.audio_processor.swap_channels(channel, other - 1)
+            self._refresh_spectrogram()
+            self.status_bar.config(text=f"Каналы {channel + 1} и {other} переставлены")
+
+        except ValueError as e:
+            messagebox.showerror("Ошибка", f"Неверный номер канала!\n{str(e)}")
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось переставить каналы:\n{str(e)}")
+
+    def extract_channels(self):
+        """Извлечение всех каналов в отдельные файлы"""
+        if not self.audio_processor:
+            messagebox.showwarning("Предупреждение", "Сначала загрузите аудиофайл!")
+            return
+
+        directory = filedialog.askdirectory(title="Папка для каналов")
+        if not directory:
+            return
+
+        try:
+            base_name = os.path.splitext(os.path.basename(self.current_file_path))[0]
+            channels = self.audio_processor.get_channels()
+            output_paths = [
+                os.path.join(directory, f"{base_name}_ch{channel + 1}.wav")
+                for channel in range(channels)
+            ]
+            self.audio_processor.extract_channels(output_paths)
+
+            self.status_bar.config(text=f"Извлечено каналов: {channels}")
+            messagebox.showinfo("Успех", f"Каналы сохранены в папку:\n{directory}")
+
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось извлечь каналы:\n{str(e)}")
+
+    def show_spectrogram(self):
+        """Открытие окна спектрограммы"""
+        if not self.audio_processor:
+            messagebox.showwarning("Предупреждение", "Сначала загрузите аудиофайл!")
+            return
+
+        if self.spectrogram_window and self.spectrogram_window.is_open():
+            self.spectrogram_window.lift()
+            return
+
+        try:
+            self.spectrogram_window = SpectrogramWindow(self.root, self.audio_processor)
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось построить спектрограмму:\n{str(e)}")
+
+    def _refresh_spectrogram(self):
+        """Перерисовка открытой спектрограммы после изменения аудио"""
+        if self.spectrogram_window and self.spectrogram_window.is_open():
+            self.spectrogram_window.refresh()
+
+    def _close_spectrogram(self):
+        """Закрытие спектрограммы предыдущего файла"""
+        if self.spectrogram_window and self.spectrogram_window.is_open():
+            self.spectrogram_window.close()
+        self.spectrogram_window = None
+
     def save_file(self):
         """Сохранение аудиофайла"""
         if not self.audio_processor:
@@ -229,6 +489,7 @@ class AudioRedactorGUI:
             defaultextension=".wav",
             filetypes=[
                 ("WAV файлы", "*.wav"),
+                ("Wave64 файлы", "*.w64"),
                 ("MP3 файлы", "*.mp3"),
                 ("Все файлы", "*.*")
             ]
@@ -236,7 +497,13 @@ class AudioRedactorGUI:
 
         if file_path:
             try:
-                self.audio_processor.save(file_path)
+                bit_depth = self.bit_depth_var.get()
+                self.audio_processor.save(
+                    file_path,
+                    sample_width=int(bit_depth) // 8 if bit_depth.isdigit() else None,
+                    dither="tpdf" if self.dither_var.get() else "none",
+                    noise_shaping=self.noise_shaping_var.get()
+                )
                 filename = os.path.basename(file_path)
                 self.status_bar.config(text=f"Сохранено: {filename}")
                 messagebox.showinfo("Успех", f"Файл сохранён:\n{file_path}")
@@ -245,6 +512,171 @@ class AudioRedactorGUI:
                 messagebox.showerror("Ошибка", f"Не удалось сохранить файл:\n{str(e)}")
 
 
+class SpectrogramWindow:
+    """Окно спектрограммы с прокруткой и масштабированием"""
+
+    HEIGHT = 256
+    MIN_DB = -100.0
+    POLL_MS = 100
+
+    def __init__(self, master, audio_processor):
+        self.audio_processor = audio_processor
+        self.analyzer = SpectrumAnalyzer(audio_processor)
+        self.cache = SpectrogramTileCache(self.analyzer)
+        self.zoom = min(2, self.cache.get_max_zoom())
+
+        # Изображения тайлов текущего масштаба: {номер тайла: PhotoImage}
+        self.images = {}
+        self.palette = self._make_palette()
+        self.poll_job = None
+
+        self.window = tk.Toplevel(master)
+        self.window.title("Спектрограмма")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self._create_widgets()
+        self.refresh()
+
+    def _create_widgets(self):
+        """Создание элементов окна"""
+        toolbar = tk.Frame(self.window)
+        toolbar.pack(fill="x", padx=5, pady=5)
+
+        tk.Button(toolbar, text="−", width=3, command=lambda: self.set_zoom(self.zoom + 1)).pack(side="left")
+        tk.Button(toolbar, text="+", width=3, command=lambda: self.set_zoom(self.zoom - 1)).pack(side="left", padx=5)
+
+        self.zoom_label = tk.Label(toolbar, text="", fg="gray")
+        self.zoom_label.pack(side="left", padx=5)
+
+        self.error_label = tk.Label(toolbar, text="", fg="red")
+        self.error_label.pack(side="left", padx=5)
+
+        nyquist = self.audio_processor.get_sample_rate() / 2
+        tk.Label(toolbar, text=f"0 – {nyquist:.0f} Гц", fg="gray").pack(side="right")
+
+        self.canvas = tk.Canvas(self.window, width=800, height=self.HEIGHT, bg="black", highlightthickness=0)
+        self.canvas.pack(fill="x")
+
+        scrollbar = tk.Scrollbar(self.window, orient=tk.HORIZONTAL, command=self._on_scroll)
+        scrollbar.pack(fill="x")
+        self.canvas.config(xscrollcommand=scrollbar.set)
+        self.canvas.bind("<Configure>", lambda event: self._draw_visible())
+
+    @staticmethod
+    def _make_palette():
+        """Цветовая шкала: чёрный - синий - красный - жёлтый - белый"""
+        stops = [(0, 0, 0), (0, 0, 160), (200, 0, 80), (255, 200, 0), (255, 255, 255)]
+        palette = []
+        for i in range(256):
+            position = i / 255 * (len(stops) - 1)
+            low = min(int(position), len(stops) - 2)
+            t = position - low
+            r, g, b = (int(a + (c - a) * t) for a, c in zip(stops[low], stops[low + 1]))
+            palette.append(f"#{r:02x}{g:02x}{b:02x}")
+        return palette
+
+    def is_open(self):
+        """Открыто ли окно"""
+        return self.window is not None
+
+    def lift(self):
+        """Показать окно поверх остальных"""
+        self.window.lift()
+
+    def close(self):
+        """Закрытие окна и остановка фонового потока"""
+        if self.poll_job:
+            self.window.after_cancel(self.poll_job)
+            self.poll_job = None
+        self.cache.stop()
+        self.window.destroy()
+        self.window = None
+
+    def refresh(self):
+        """Сброс тайлов после изменения аудио"""
+        self.cache.invalidate()
+        self.zoom = min(self.zoom, self.cache.get_max_zoom())
+        self._reset_canvas()
+
+    def set_zoom(self, zoom):
+        """Смена уровня масштаба с сохранением позиции прокрутки"""
+        zoom = max(0, min(zoom, self.cache.get_max_zoom()))
+        if zoom == self.zoom:
+            return
+        position = self.canvas.xview()[0]
+        self.zoom = zoom
+        self._reset_canvas()
+        self.canvas.xview_moveto(position)
+        self._draw_visible()
+
+    def _reset_canvas(self):
+        """Очистка холста для текущего масштаба"""
+        self.canvas.delete("all")
+        self.images.clear()
+        width = self.cache.get_column_count(self.zoom)
+        self.canvas.config(scrollregion=(0, 0, width, self.HEIGHT))
+
+        seconds = self.cache.get_step(self.zoom) / self.audio_processor.get_sample_rate()
+        self.zoom_label.config(text=f"{seconds * 1000:.1f} мс/пиксель")
+        self._draw_visible()
+
+    def _on_scroll(self, *args):
+        """Обработка прокрутки"""
+        self.canvas.xview(*args)
+        self._draw_visible()
+
+    def _draw_visible(self):
+        """Отрисовка готовых видимых тайлов и запрос остальных"""
+        if not self.is_open():
+            return
+
+        tile_width = self.cache.tile_width
+        left = int(self.canvas.canvasx(0))
+        right = int(self.canvas.canvasx(self.canvas.winfo_width()))
+        first = max(left // tile_width, 0)
+        last = min(right // tile_width, self.cache.get_tile_count(self.zoom) - 1)
+
+        for index in range(first, last + 1):
+            if index in self.images:
+                continue
+            tile = self.cache.get_tile(self.zoom, index)
+            if tile:
+                self.images[index] = self._render_tile(tile)
+                self.canvas.create_image(index * tile_width, 0, image=self.images[index], anchor="nw")
+
+        errors = [
+            message for (zoom, index), message in self.cache.get_errors().items()
+            if zoom == self.zoom and first <= index <= last
+        ]
+        self.error_label.config(text=f"Ошибка вычисления: {errors[0]}" if errors else "")
+
+        if self.poll_job is None and self.cache.has_pending():
+            self.poll_job = self.window.after(self.POLL_MS, self._poll)
+
+    def _poll(self):
+        """Периодическая проверка готовности тайлов"""
+        self.poll_job = None
+        self._draw_visible()
+
+    def _render_tile(self, tile):
+        """Преобразование столбцов тайла в изображение"""
+        bins = len(tile[0])
+        rows = [int((self.HEIGHT - 1 - y) * (bins - 1) / (self.HEIGHT - 1)) for y in range(self.HEIGHT)]
+        scale = 255 / -self.MIN_DB
+        colors = [
+            [self.palette[max(0, min(255, int((level - self.MIN_DB) * scale)))] for level in column]
+            for column in tile
+        ]
+
+        image = tk.PhotoImage(width=len(tile), height=self.HEIGHT)
+        data = " ".join(
+            "{" + " ".join(column[row] for column in colors) + "}"
+            for row in rows
+        )
+        image.put(data, to=(0, 0))
+        return image
+
+
 def main():
     """Точка входа в приложение"""
     root = tk.Tk()